@@ -291,7 +291,7 @@ class BreakNode(Node):
         _: Context,
         __: TextIO,
     ) -> Optional[bool]:
-        raise BreakLoop("break")
+        raise BreakLoop
 
     def children(self) -> List[ChildNode]:
         return []
@@ -313,7 +313,7 @@ class ContinueNode(Node):
         _: Context,
         __: TextIO,
     ) -> Optional[bool]:
-        raise ContinueLoop("continue")
+        raise ContinueLoop
 
     def children(self) -> List[ChildNode]:
         return []
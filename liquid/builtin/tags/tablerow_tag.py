@@ -1,5 +1,6 @@
 """Tag and node definition for the built-in "tablerow" tag."""
 import sys
+from functools import lru_cache
 from typing import Any
 from typing import Dict
 from typing import Iterator
@@ -13,6 +14,7 @@ from liquid.ast import ChildNode
 from liquid.ast import Node
 from liquid.context import Context
 from liquid.expression import NIL
+from liquid.expression import IntegerLiteral
 from liquid.expression import LoopExpression
 from liquid.limits import to_int
 from liquid.parse import expect
@@ -30,6 +32,22 @@ TAG_ENDTABLEROW = sys.intern("endtablerow")
 
 END_TAGBLOCK = frozenset((TAG_ENDTABLEROW,))
 
+_OPEN_ROW1 = sys.intern('<tr class="row1">\n')
+_END_CELL = sys.intern("</td>")
+_END_ROW = sys.intern("</tr>\n")
+
+
+@lru_cache(maxsize=128)
+def _col_tag(col: int) -> str:
+    """Return an opening `<td>` tag for column number `col`."""
+    return f'<td class="col{col}">'
+
+
+@lru_cache(maxsize=128)
+def _row_tag(row: int) -> str:
+    """Return tags closing the current cell and row, then opening row `row`."""
+    return f'</td></tr>\n<tr class="row{row}">'
+
 
 class TableRow(Mapping[str, object]):
     """Table row helper variables."""
@@ -61,6 +79,8 @@ class TableRow(Mapping[str, object]):
         ]
     )
 
+    _n_keys = len(_keys)
+
     def __init__(self, name: str, it: Iterator[Any], length: int, ncols: int) -> None:
         self.name = name
         self.it = it
@@ -78,8 +98,11 @@ class TableRow(Mapping[str, object]):
             return getattr(self, key)
         raise KeyError(key)
 
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
     def __len__(self) -> int:
-        return len(self._keys)
+        return self._n_keys
 
     def __iter__(self) -> Iterator[Any]:
         return self
@@ -145,8 +168,13 @@ class TableRow(Mapping[str, object]):
 
     def step(self) -> None:
         """Step the forloop forward."""
-        self._index += 1
-        if self._col == self.ncols:
+        index = self._index = self._index + 1
+        ncols = self.ncols
+        if ncols > 0:
+            row, col = divmod(index, ncols)
+            self._col = col + 1
+            self._row = row + 1
+        elif self._col == ncols:
             self._col = 1
             self._row += 1
         else:
@@ -156,7 +184,7 @@ class TableRow(Mapping[str, object]):
 class TablerowNode(Node):
     """Parse tree node for the built-in "tablerow" tag."""
 
-    __slots__ = ("tok", "expression", "block")
+    __slots__ = ("tok", "expression", "block", "_cols")
 
     def __init__(
         self,
@@ -168,6 +196,13 @@ class TablerowNode(Node):
         self.expression = expression
         self.block = block
 
+        # Fold a literal `cols` argument at parse time. `None` means `cols`
+        # must be evaluated against a render context.
+        if isinstance(expression.cols, IntegerLiteral):
+            self._cols: Optional[int] = self._int_or_zero(expression.cols.value)
+        else:
+            self._cols = None
+
     def __str__(self) -> str:
         return f"tablerow({ self.expression }) {{ {self.block} }}"
 
@@ -181,10 +216,12 @@ class TablerowNode(Node):
         name = self.expression.name
         loop_iter, length = self.expression.evaluate(context)
 
-        if self.expression.cols and self.expression.cols != NIL:
-            cols = self._int_or_zero(self.expression.cols.evaluate(context))
-        else:
-            cols = length
+        cols = self._cols
+        if cols is None:
+            if self.expression.cols and self.expression.cols != NIL:
+                cols = self._int_or_zero(self.expression.cols.evaluate(context))
+            else:
+                cols = length
 
         context.raise_for_loop_limit(length)
         tablerow = TableRow(name, loop_iter, length, cols)
@@ -193,19 +230,34 @@ class TablerowNode(Node):
             "tablerowloop": tablerow,
         }
 
-        buffer.write('<tr class="row1">\n')
-
-        with context.extend(namespace):
-            for item in tablerow:
-                namespace[name] = item
-                buffer.write(f'<td class="col{tablerow.col}">')
-                self.block.render(context=context, buffer=buffer)
-                buffer.write("</td>")
+        render_block = self.block.render
 
-                if tablerow.col_last and not tablerow.last:
-                    buffer.write(f'</tr>\n<tr class="row{tablerow.row + 1}">')
+        # Accumulate output in an intermediate buffer, flushing to the output
+        # buffer at row boundaries rather than once per tag fragment.
+        row_buf = context.get_buffer(buffer)
+        row_write = row_buf.write
+        row_write(_OPEN_ROW1)
 
-            buffer.write("</tr>\n")
+        with context.extend(namespace):
+            try:
+                for item in tablerow:
+                    namespace[name] = item
+                    row_write(_col_tag(tablerow.col))
+                    render_block(context=context, buffer=row_buf)
+
+                    if tablerow.col_last and not tablerow.last:
+                        row_write(_row_tag(tablerow.row + 1))
+                        buffer.write(row_buf.getvalue())
+                        row_buf.seek(0)
+                        row_buf.truncate()
+                    else:
+                        row_write(_END_CELL)
+
+                row_write(_END_ROW)
+            finally:
+                # Flush buffered output even when an interrupt or error
+                # escapes the block, like `break` from an enclosing for loop.
+                buffer.write(row_buf.getvalue())
         return True
 
     async def render_to_output_async(
@@ -214,10 +266,14 @@ class TablerowNode(Node):
         name = self.expression.name
         loop_iter, length = await self.expression.evaluate_async(context)
 
-        if self.expression.cols and self.expression.cols != NIL:
-            cols = self._int_or_zero(await self.expression.cols.evaluate_async(context))
-        else:
-            cols = length
+        cols = self._cols
+        if cols is None:
+            if self.expression.cols and self.expression.cols != NIL:
+                cols = self._int_or_zero(
+                    await self.expression.cols.evaluate_async(context)
+                )
+            else:
+                cols = length
 
         context.raise_for_loop_limit(length)
         tablerow = TableRow(name, loop_iter, length, cols)
@@ -226,19 +282,34 @@ class TablerowNode(Node):
             "tablerowloop": tablerow,
         }
 
-        buffer.write('<tr class="row1">\n')
-
-        with context.extend(namespace):
-            for item in tablerow:
-                namespace[name] = item
-                buffer.write(f'<td class="col{tablerow.col}">')
-                await self.block.render_async(context=context, buffer=buffer)
-                buffer.write("</td>")
+        render_block = self.block.render_async
 
-                if tablerow.col_last and not tablerow.last:
-                    buffer.write(f'</tr>\n<tr class="row{tablerow.row + 1}">')
+        # Accumulate output in an intermediate buffer, flushing to the output
+        # buffer at row boundaries rather than once per tag fragment.
+        row_buf = context.get_buffer(buffer)
+        row_write = row_buf.write
+        row_write(_OPEN_ROW1)
 
-            buffer.write("</tr>\n")
+        with context.extend(namespace):
+            try:
+                for item in tablerow:
+                    namespace[name] = item
+                    row_write(_col_tag(tablerow.col))
+                    await render_block(context=context, buffer=row_buf)
+
+                    if tablerow.col_last and not tablerow.last:
+                        row_write(_row_tag(tablerow.row + 1))
+                        buffer.write(row_buf.getvalue())
+                        row_buf.seek(0)
+                        row_buf.truncate()
+                    else:
+                        row_write(_END_CELL)
+
+                row_write(_END_ROW)
+            finally:
+                # Flush buffered output even when an interrupt or error
+                # escapes the block, like `break` from an enclosing for loop.
+                buffer.write(row_buf.getvalue())
         return True
 
     def children(self) -> List[ChildNode]:
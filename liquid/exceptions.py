@@ -1,16 +1,24 @@
 """Liquid specific Exceptions and warnings."""
 
-from pathlib import Path
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 from typing import Any
-from typing import Dict
 from typing import Optional
 from typing import Type
 from typing import Union
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 class Error(Exception):
     """Base class for all Liquid exceptions."""
 
+    #: The warning category used in place of this exception when in WARN mode.
+    #: Assigned after the warning classes are defined below.
+    warning_class: Type["LiquidWarning"]
+
     def __init__(
         self,
         *args: object,
@@ -24,9 +32,11 @@ class Error(Exception):
     def __str__(self) -> str:
         msg = super().__str__()
         if self.linenum:
-            msg = f"{msg}, on line {self.linenum}"
+            if self.filename:
+                return f"{msg}, on line {self.linenum} of {self.filename}"
+            return f"{msg}, on line {self.linenum}"
         if self.filename:
-            msg += f" of {self.filename}"
+            return f"{msg} of {self.filename}"
         return msg
 
     @property
@@ -42,6 +52,8 @@ class Error(Exception):
 
         An empty string is return if a name is not available.
         """
+        from pathlib import Path
+
         if isinstance(self.filename, Path):
             return self.filename.as_posix()
         if self.filename:
@@ -171,10 +183,16 @@ class UndefinedError(Error):
 class BreakLoop(LiquidInterrupt):
     """Exception raised when a BreakNode is rendered."""
 
+    def __str__(self) -> str:
+        return super().__str__() or "break"
+
 
 class ContinueLoop(LiquidInterrupt):
     """Exception raised when a ContinueNode is rendered."""
 
+    def __str__(self) -> str:
+        return super().__str__() or "continue"
+
 
 class TemplateTraversalError(Error):
     """Exception raised when an AST node or expression can not be visited."""
@@ -196,17 +214,18 @@ class FilterWarning(LiquidWarning):
     """Replaces filter exceptions when in WARN mode."""
 
 
-WARNINGS: Dict[Type[Error], Type[LiquidWarning]] = {
-    LiquidSyntaxError: LiquidSyntaxWarning,
-    LiquidTypeError: LiquidTypeWarning,
-    FilterArgumentError: FilterWarning,
-    NoSuchFilterFunc: FilterWarning,
-}
+# Warning categories used in place of exceptions when in WARN mode. Set as
+# class attributes so subclasses inherit their parent's warning category.
+Error.warning_class = LiquidWarning
+LiquidSyntaxError.warning_class = LiquidSyntaxWarning
+LiquidTypeError.warning_class = LiquidTypeWarning
+FilterArgumentError.warning_class = FilterWarning
+NoSuchFilterFunc.warning_class = FilterWarning
 
 
 def lookup_warning(exc: Type[Error]) -> Type[LiquidWarning]:
     """Return a warning equivalent of the given exception."""
-    return WARNINGS.get(exc, LiquidWarning)
+    return exc.warning_class
 
 
 def escape(_: Any) -> str:
@@ -221,20 +240,14 @@ class Markup(str):
         super().__init__()
         raise Error("autoescape requires Markupsafe to be installed")
 
-    def join(self, _: object) -> str:  # noqa: D102
+    def _fail(self, *args: Any, **kwargs: Any) -> str:  # noqa: ARG002
         raise Error(
             "autoescape requires Markupsafe to be installed"
         )  # pragma: no cover
 
-    def unescape(self) -> str:  # noqa: D102
-        raise Error(
-            "autoescape requires Markupsafe to be installed"
-        )  # pragma: no cover
-
-    def format(self, *args: Any, **kwargs: Any) -> str:  # noqa: A003, D102, ARG002
-        raise Error(
-            "autoescape requires Markupsafe to be installed"
-        )  # pragma: no cover
+    join = _fail
+    unescape = _fail
+    format = _fail  # noqa: A003
 
 
 class CacheCapacityValueError(ValueError):
@@ -1,24 +1,10 @@
 from __future__ import annotations  # noqa: D104
 
+from importlib import import_module
 from typing import TYPE_CHECKING
-
-from .filters import JSON
-from .filters import index
-from .filters import script_tag
-from .filters import sort_numeric
-from .filters import stylesheet_tag
-from .tags import BlockTag
-from .tags import CallTag
-from .tags import ExtendsTag
-from .tags import IfNotTag
-from .tags import InlineIfAssignTag
-from .tags import InlineIfAssignTagWithParens
-from .tags import InlineIfEchoTag
-from .tags import InlineIfEchoTagWithParens
-from .tags import InlineIfStatement
-from .tags import InlineIfStatementWithParens
-from .tags import MacroTag
-from .tags import WithTag
+from typing import Any
+from typing import Dict
+from typing import List
 
 if TYPE_CHECKING:
     from liquid import Environment
@@ -49,6 +35,47 @@ __all__ = (
     "WithTag",
 )
 
+# Map of lazily imported names to the submodule that defines them. Extra tags
+# and filters are only imported when first accessed (PEP 562), keeping
+# `import liquid.extra` cheap for applications that use a subset of them.
+_lazy_imports: Dict[str, str] = {
+    "JSON": "liquid.extra.filters",
+    "index": "liquid.extra.filters",
+    "script_tag": "liquid.extra.filters",
+    "sort_numeric": "liquid.extra.filters",
+    "stylesheet_tag": "liquid.extra.filters",
+    "BlockTag": "liquid.extra.tags",
+    "CallTag": "liquid.extra.tags",
+    "ExtendsTag": "liquid.extra.tags",
+    "IfNotTag": "liquid.extra.tags",
+    "InlineIfAssignTag": "liquid.extra.tags",
+    "InlineIfAssignTagWithParens": "liquid.extra.tags",
+    "InlineIfEchoTag": "liquid.extra.tags",
+    "InlineIfEchoTagWithParens": "liquid.extra.tags",
+    "InlineIfStatement": "liquid.extra.tags",
+    "InlineIfStatementWithParens": "liquid.extra.tags",
+    "MacroTag": "liquid.extra.tags",
+    "WithTag": "liquid.extra.tags",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import extra tags and filters on first access."""
+    try:
+        module = import_module(_lazy_imports[name])
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    obj = getattr(module, name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> List[str]:
+    """Include lazily imported names in the module's dir()."""
+    return sorted(set(globals()) | set(_lazy_imports))
+
 
 def add_inline_expression_tags(env: Environment) -> None:
     """Add extra inline expression tags to an environment.
@@ -57,6 +84,10 @@ def add_inline_expression_tags(env: Environment) -> None:
     `echo` tag and `assign` tag with ones that support inline `if`
     expressions.
     """
+    from .tags import InlineIfAssignTag
+    from .tags import InlineIfEchoTag
+    from .tags import InlineIfStatement
+
     env.add_tag(InlineIfAssignTag)
     env.add_tag(InlineIfEchoTag)
     env.add_tag(InlineIfStatement)
@@ -69,6 +100,10 @@ def add_extended_inline_expression_tags(env: Environment) -> None:
     `echo` tag and `assign` tag with ones that support inline `if`
     expressions.
     """
+    from .tags import InlineIfAssignTagWithParens
+    from .tags import InlineIfEchoTagWithParens
+    from .tags import InlineIfStatementWithParens
+
     env.add_tag(InlineIfAssignTagWithParens)
     env.add_tag(InlineIfEchoTagWithParens)
     env.add_tag(InlineIfStatementWithParens)
@@ -76,18 +111,27 @@ def add_extended_inline_expression_tags(env: Environment) -> None:
 
 def add_macro_tags(env: Environment) -> None:
     """Register both the `macro` and `call` tags with an environment."""
+    from .tags import CallTag
+    from .tags import MacroTag
+
     env.add_tag(CallTag)
     env.add_tag(MacroTag)
 
 
 def add_inheritance_tags(env: Environment) -> None:
     """Register both the `extends` and `block` tags with an environment."""
+    from .tags import BlockTag
+    from .tags import ExtendsTag
+
     env.add_tag(BlockTag)
     env.add_tag(ExtendsTag)
 
 
 def add_tags(env: Environment) -> None:  # pragma: no cover
     """Register all extra tags with an environment."""
+    from .tags import IfNotTag
+    from .tags import WithTag
+
     env.add_tag(IfNotTag)
     env.add_tag(WithTag)
     add_extended_inline_expression_tags(env)
@@ -97,6 +141,12 @@ def add_tags(env: Environment) -> None:  # pragma: no cover
 
 def add_filters(env: Environment) -> None:
     """Register all extra filters with an environment with their default options."""
+    from .filters import JSON
+    from .filters import index
+    from .filters import script_tag
+    from .filters import sort_numeric
+    from .filters import stylesheet_tag
+
     env.add_filter("index", index)
     env.add_filter("json", JSON())
     env.add_filter("script_tag", script_tag)
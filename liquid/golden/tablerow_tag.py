@@ -282,6 +282,20 @@ cases = [
             "</tr>\n"
         ),
     ),
+    Case(
+        description="cols is zero",
+        template=(
+            r"{% tablerow i in (1..4) cols:0 %}{{ i }}{% endtablerow %}"
+        ),
+        expect=(
+            '<tr class="row1">\n'
+            '<td class="col1">1</td>'
+            '<td class="col2">2</td>'
+            '<td class="col3">3</td>'
+            '<td class="col4">4</td>'
+            "</tr>\n"
+        ),
+    ),
     # Case(
     #     description="cols is non number string",
     #     template=(
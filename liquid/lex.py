@@ -16,6 +16,7 @@ package.
 from __future__ import annotations
 
 import re
+import sys
 from functools import lru_cache
 from functools import partial
 from typing import Callable
@@ -313,7 +314,7 @@ def _tokenize_liquid_expression(
             if name == comment_start_string:
                 continue
 
-            yield Token(line_num, TOKEN_TAG, name)
+            yield Token(line_num, TOKEN_TAG, sys.intern(name))
 
             if match.group("expr"):
                 yield Token(line_num, TOKEN_EXPRESSION, match.group("expr"))
@@ -463,7 +464,7 @@ def _tokenize_template(source: str, rules: Pattern[str]) -> Iterator[Token]:
 
         elif kind == "TAG":
             name = match.group("name")
-            yield Token(line_num, TOKEN_TAG, name)
+            yield Token(line_num, TOKEN_TAG, sys.intern(name))
 
             kind = TOKEN_EXPRESSION
             value = match.group("expr")
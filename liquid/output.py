@@ -1,10 +1,55 @@
 """Template output streams."""
 from io import StringIO
+from io import UnsupportedOperation
+from typing import List
 from typing import Optional
 
 from liquid.exceptions import OutputStreamLimitError
 
 
+class StringBuffer(StringIO):
+    """A StringIO subclass that accumulates fragments and joins them once.
+
+    Writes append to a list instead of copying into StringIO's internal
+    buffer, with `getvalue` joining the fragments in a single pass. Only
+    `write` and `getvalue` are supported; reading, seeking and truncation
+    raise an `io.UnsupportedOperation`.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._parts: List[str] = []
+        # Bind the list's append method as this buffer's write. It returns
+        # None rather than a character count, which no render path uses.
+        self.write = self._parts.append  # type: ignore[assignment]
+
+    def getvalue(self) -> str:  # noqa: D102
+        return "".join(self._parts)
+
+    def readable(self) -> bool:  # noqa: D102
+        return False
+
+    def seekable(self) -> bool:  # noqa: D102
+        return False
+
+    def read(self, __size: Optional[int] = -1) -> str:  # noqa: D102
+        raise UnsupportedOperation("string buffer is not readable")
+
+    def readline(  # type: ignore[override] # noqa: D102
+        self, __size: Optional[int] = -1
+    ) -> str:
+        raise UnsupportedOperation("string buffer is not readable")
+
+    def seek(self, __cookie: int, __whence: int = 0) -> int:  # noqa: D102
+        raise UnsupportedOperation("string buffer is not seekable")
+
+    def tell(self) -> int:  # noqa: D102
+        raise UnsupportedOperation("string buffer is not seekable")
+
+    def truncate(self, __size: Optional[int] = None) -> int:  # noqa: D102
+        raise UnsupportedOperation("string buffer does not support truncation")
+
+
 class LimitedStringIO(StringIO):
     """A StringIO subclass that limits the number of bytes that can be written."""
 
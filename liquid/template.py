@@ -3,7 +3,6 @@ from __future__ import annotations
 
 from collections import Counter
 from collections import abc
-from io import StringIO
 from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
@@ -25,6 +24,7 @@ from liquid.exceptions import LiquidInterrupt
 from liquid.exceptions import LiquidSyntaxError
 from liquid.exceptions import StopRender
 from liquid.output import LimitedStringIO
+from liquid.output import StringBuffer
 from liquid.static_analysis import ContextualTemplateAnalysis
 from liquid.static_analysis import NameRefs
 from liquid.static_analysis import ReferencedVariable
@@ -33,6 +33,8 @@ from liquid.static_analysis import TemplateAnalysis
 from liquid.static_analysis import _TemplateCounter
 
 if TYPE_CHECKING:
+    from io import StringIO
+
     from liquid import Environment
     from liquid.ast import ParseTree
     from liquid.loaders import UpToDate
@@ -122,7 +124,7 @@ class BoundTemplate:
 
     def _get_buffer(self) -> StringIO:
         if self.env.output_stream_limit is None:
-            return StringIO()
+            return StringBuffer()
         return LimitedStringIO(limit=self.env.output_stream_limit)
 
     def render_with_context(
@@ -39,6 +39,19 @@ class LiquidErrorTestCase(TestCase):
         except Error as err:
             self.assertEqual(str(err), "Oh no!, on line 1 of foo.liquid")
 
+    def test_base_error_message_forms(self):
+        """Test every combination of error message, line number and filename."""
+        self.assertEqual(str(Error("Oh no!")), "Oh no!")
+        self.assertEqual(str(Error("Oh no!", linenum=1)), "Oh no!, on line 1")
+        self.assertEqual(
+            str(Error("Oh no!", linenum=1, filename="foo.liquid")),
+            "Oh no!, on line 1 of foo.liquid",
+        )
+        self.assertEqual(
+            str(Error("Oh no!", filename="foo.liquid")),
+            "Oh no! of foo.liquid",
+        )
+
 
 class LiquidSyntaxErrorTestCase(TestCase):
     def test_template_name_from_string(self):
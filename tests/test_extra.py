@@ -0,0 +1,27 @@
+"""Test cases for lazily loaded names in the liquid.extra package."""
+import unittest
+
+import liquid.extra
+
+
+class LazyExtraTestCase(unittest.TestCase):
+    """Lazy import test cases for liquid.extra."""
+
+    def test_unknown_attribute(self):
+        """Test that unknown attributes raise an AttributeError."""
+        with self.assertRaises(AttributeError):
+            liquid.extra.nosuchthing  # noqa: B018
+
+    def test_dir_includes_lazy_names(self):
+        """Test that lazily imported names appear in dir()."""
+        names = dir(liquid.extra)
+        self.assertIn("CallTag", names)
+        self.assertIn("JSON", names)
+        self.assertIn("add_filters", names)
+
+    def test_lazy_name_resolves(self):
+        """Test that lazy names resolve to their defining submodule."""
+        from liquid.extra import CallTag
+        from liquid.extra.tags import CallTag as _CallTag
+
+        self.assertIs(CallTag, _CallTag)
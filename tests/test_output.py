@@ -0,0 +1,49 @@
+"""Template output stream test cases."""
+import unittest
+from io import UnsupportedOperation
+
+from liquid import Environment
+from liquid.output import StringBuffer
+
+
+class StringBufferTestCase(unittest.TestCase):
+    """String buffer test cases."""
+
+    def test_write_then_getvalue(self):
+        """Test that written fragments are joined by getvalue."""
+        buf = StringBuffer()
+        buf.write("Hello, ")
+        buf.write("World!")
+        self.assertEqual(buf.getvalue(), "Hello, World!")
+
+    def test_not_readable(self):
+        """Test that string buffers can not be read from."""
+        buf = StringBuffer()
+        self.assertFalse(buf.readable())
+
+        with self.assertRaises(UnsupportedOperation):
+            buf.read()
+
+        with self.assertRaises(UnsupportedOperation):
+            buf.readline()
+
+    def test_not_seekable(self):
+        """Test that string buffers can not seek or truncate."""
+        buf = StringBuffer()
+        self.assertFalse(buf.seekable())
+
+        with self.assertRaises(UnsupportedOperation):
+            buf.seek(0)
+
+        with self.assertRaises(UnsupportedOperation):
+            buf.tell()
+
+        with self.assertRaises(UnsupportedOperation):
+            buf.truncate()
+
+    def test_render_to_string_buffer(self):
+        """Test that templates render through a string buffer by default."""
+        env = Environment()
+        self.assertIsNone(env.output_stream_limit)
+        template = env.from_string("Hello, {{ you }}!")
+        self.assertEqual(template.render(you="World"), "Hello, World!")
@@ -0,0 +1,41 @@
+"""Tablerow loop helper test cases."""
+import asyncio
+import unittest
+
+from liquid import Environment
+from liquid.builtin.tags.tablerow_tag import TableRow
+
+
+class TableRowTestCase(unittest.TestCase):
+    """Tablerow loop helper test cases."""
+
+    def test_contains(self):
+        """Test that membership tests agree with item access."""
+        tablerow = TableRow("product", iter(["a", "b", "c", "d"]), 4, 2)
+
+        self.assertIn("col", tablerow)
+        self.assertIn("first", tablerow)
+        self.assertNotIn("nosuchthing", tablerow)
+
+        self.assertEqual(tablerow["col"], 0)
+
+        with self.assertRaises(KeyError):
+            tablerow["nosuchthing"]
+
+    def test_length(self):
+        """Test that the helper exposes all twelve documented keys."""
+        tablerow = TableRow("product", iter(["a", "b"]), 2, 2)
+        self.assertEqual(len(tablerow), 12)
+
+    def test_break_from_enclosing_for_loop(self):
+        """Test that output is flushed when an interrupt escapes a tablerow."""
+        env = Environment()
+        template = env.from_string(
+            "{% for x in (1..2) %}"
+            "{% tablerow i in (1..3) %}A{% break %}{% endtablerow %}"
+            "{% endfor %}done"
+        )
+        expect = '<tr class="row1">\n<td class="col1">Adone'
+
+        self.assertEqual(template.render(), expect)
+        self.assertEqual(asyncio.run(template.render_async()), expect)